@@ -8,9 +8,6 @@ from icecream import ic
 
 from csv2notion_neo.version import __version__
 from csv2notion_neo.cli_args import parse_args
-from csv2notion_neo.cli_steps import convert_csv_to_notion_rows, new_database, upload_rows
-from csv2notion_neo.local_data import LocalData
-from csv2notion_neo.notion_db import get_collection_id, get_notion_client
 from csv2notion_neo.utils_exceptions import CriticalError, NotionError
 
 logger = logging.getLogger(__name__)
@@ -20,7 +17,12 @@ def cli(*argv: str) -> None:
     try:
         ic.disable()
         args = parse_args(argv)
-            
+
+        # deferred so that --help and --version don't load the notion client
+        from csv2notion_neo.cli_steps import convert_csv_to_notion_rows, new_database, upload_rows
+        from csv2notion_neo.local_data import LocalData
+        from csv2notion_neo.notion_db import get_collection_id, get_notion_client
+
         setup_logging(is_verbose=args.verbose, log_file=args.log)
         logger.info(f"CSV2Notion Neo version {__version__}")
 
@@ -65,6 +67,9 @@ def cli(*argv: str) -> None:
 
         logger.info("Done!")
 
+    except ImportError:
+        # deferred imports above must still fail with a traceback
+        raise
     except Exception as e:
         if args.verbose:
             logger.error('Error at %s', 'division', exc_info=e)
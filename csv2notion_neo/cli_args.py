@@ -1,23 +1,36 @@
 import argparse
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Sequence, Tuple, Union
 
-from csv2notion_neo.notion_convert_map import map_icon
 from csv2notion_neo.utils_exceptions import CriticalError
 from csv2notion_neo.utils_static import ALLOWED_TYPES, FileType
-from csv2notion_neo.utils_str import split_str
 from csv2notion_neo.version import __version__
 
 ArgToken = Union[str, Tuple[str, str]]
 ArgOption = Dict[str, Any]
 ArgSchema = Dict[str, Dict[ArgToken, ArgOption]]
 HELP_ARGS_WIDTH = 50
+COLUMN_TYPES_SEP_RE = re.compile(r"\s*,\s*")
 
 class CustomHelpFormatter(argparse.RawTextHelpFormatter):
     def _format_args(self, action, default_metavar):
         return ""
     
 def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    args = _build_parser().parse_args(argv)
+
+    # parser is cached, so don't hand out its shared list defaults
+    for arg_name, arg_value in vars(args).items():
+        if isinstance(arg_value, list):
+            setattr(args, arg_name, list(arg_value))
+
+    return args
+
+
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="csv2notion_neo",
         description="https://github.com/TheAcharya/csv2notion-neo \n\nUpload & Merge CSV or JSON Data with Images to Notion Database",
@@ -307,7 +320,7 @@ def parse_args(argv: Sequence[str]) -> argparse.Namespace:
 
     _parse_schema(parser, schema)
 
-    return parser.parse_args(argv)
+    return parser
 
 
 def _parse_schema(  # noqa: WPS210
@@ -327,6 +340,9 @@ def _parse_schema(  # noqa: WPS210
 
 
 def _parse_default_icon(default_icon: str) -> FileType:
+    # deferred, pulls in the whole notion client stack
+    from csv2notion_neo.notion_convert_map import map_icon
+
     default_icon_filetype = map_icon(default_icon)
     if isinstance(default_icon_filetype, Path):
         if not default_icon_filetype.exists():
@@ -335,9 +351,10 @@ def _parse_default_icon(default_icon: str) -> FileType:
 
 
 def _parse_column_types(column_types: str) -> List[str]:
-
-    column_types_list = split_str(column_types)
-    unknown_types = set(column_types_list) - set(ALLOWED_TYPES)
+    column_types_list = [
+        t for t in COLUMN_TYPES_SEP_RE.split(column_types.strip()) if t
+    ]
+    unknown_types = set(column_types_list) - ALLOWED_TYPES
     if unknown_types:
         raise CriticalError(
             "Unknown types: {0}; allowed types: {1}".format(
@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Union
 
@@ -53,17 +54,22 @@ def map_number(s: str) -> Union[int, float]:
 
 
 def map_icon(s: str) -> FileType:
+    # URL check is a cheap prefix match, emoji parsing scans the whole string
+    if is_url(s):
+        return s
+
     icon_emoji = _get_icon_emoji(s)
     if icon_emoji:
         return icon_emoji
 
-    return s if is_url(s) else Path(s)
+    return Path(s)
 
 
 def map_url_or_file(s: str) -> FileType:
     return s if is_url(s) else Path(s)
 
 
+@lru_cache(maxsize=256)
 def _get_icon_emoji(s: str) -> Optional[str]:
     # string has anything other than emoji
     if replace_emoji(s) != "":
@@ -1,5 +1,5 @@
 from copy import deepcopy
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from csv2notion_neo.notion.client import NotionClient, create_session
 from csv2notion_neo.notion.space import Space
@@ -21,6 +21,9 @@ class NotionClientExtended(NotionClient):
         
         self.options = options or {}
 
+        # uploaded file URLs by (block id, file path, size, mtime)
+        self.uploaded_files: Dict[Tuple[str, str, int, int], str] = {}
+
         if old_client is None:
             super().__init__(*args, **kwargs,workspace=workspace)
             return
@@ -17,15 +17,13 @@ class CollectionExtended(Collection):
         ]
 
     def get_unique_rows(self) -> Dict[str, CollectionRowBlockExtended]:
-        rows: Dict[str, CollectionRowBlockExtended] = {}
+        titled_rows = [(row.title, row) for row in self.get_rows()]
 
-        # sort rows so that only first row is kept if multiple have same title
-        sorted_rows = sorted(self.get_rows(), key=lambda r: str(r.title))
+        # sort rows so that only first row is kept if multiple have same title,
+        # building in reverse lets earlier rows overwrite later duplicates
+        titled_rows.sort(key=lambda r: str(r[0]))
 
-        for row in sorted_rows:
-            rows.setdefault(row.title, row)
-        
-        return rows
+        return {title: row for title, row in reversed(titled_rows)}
 
     def add_row_block(
         self,
@@ -14,6 +14,11 @@ from icecream import ic
 
 Meta = Dict[str, str]
 
+# aws_host/space_id/file_id/filename
+AWS_FILE_URL_RE = re.compile(
+    r"^https://(.*?\.amazonaws\.com)/([a-f0-9\-]+)/([a-f0-9\-]+)/(.*?)$"
+)
+
 
 def upload_filetype(parent: Block, filetype: FileType) -> Tuple[str, Meta]:
 
@@ -33,13 +38,27 @@ def upload_filetype(parent: Block, filetype: FileType) -> Tuple[str, Meta]:
 
 
 def upload_file(block: Block, file_path: Path) -> Tuple[str, Meta]:
-    
-    file_url = _upload_file(block, file_path)
+    # uploaded files belong to the block they were uploaded for,
+    # so only reuse an upload of the same unchanged file for the same block
+    file_stat = file_path.stat()
+    upload_key = (
+        block.id,
+        str(file_path.resolve()),
+        file_stat.st_size,
+        file_stat.st_mtime_ns,
+    )
+    uploaded_files = block._client.uploaded_files
+
+    file_url = uploaded_files.get(upload_key)
+    if file_url is None:
+        file_url = _upload_file(block, file_path)
 
     file_id = get_file_id(file_url)
     if file_id is None:
         raise NotionError(f"Could not upload file {file_path}")
-    
+
+    uploaded_files[upload_key] = file_url
+
     return file_url, {
         "source": [
             [
@@ -83,10 +102,7 @@ def _upload_file(block: Block, file_path: Path) -> str:
 
 
 def get_file_id(image_url: str) -> Optional[str]:
-    # aws_host/space_id/file_id/filename
-    aws_re = r"^https://(.*?\.amazonaws\.com)/([a-f0-9\-]+)/([a-f0-9\-]+)/(.*?)$"
-
-    aws_match = re.search(aws_re, image_url)
+    aws_match = AWS_FILE_URL_RE.search(image_url)
 
     if aws_match:
         return aws_match.group(3)
@@ -3,6 +3,10 @@ import re
 from typing import List
 from icecream import ic
 
+URL_RE = re.compile("^https?://")
+EMAIL_RE = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+
+
 def guess_type_by_values(values_str: List[str]) -> str:
 
     if type(values_str[0]) == list:
@@ -45,14 +49,14 @@ def is_multi(s) -> bool:
 def is_url(s: str) -> bool:
 
     try:
-        return re.match("^https?://", s) is not None
+        return URL_RE.match(s) is not None
     except:
         return None
 
 
 def is_email(s: str) -> bool:
     try:
-        return re.match(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$", s) is not None
+        return EMAIL_RE.match(s) is not None
     except:
         return None
 